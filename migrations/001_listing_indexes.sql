@@ -0,0 +1,18 @@
+-- Indexes for obo-server's read paths.
+--
+-- The decks/cards tables are owned by obo-gen; obo-server only reads them.
+-- Apply once per database with psql (CONCURRENTLY cannot run inside a
+-- transaction block, so do not wrap this file in BEGIN/COMMIT):
+--
+--   psql "$OBO_DATABASE_URL" -f migrations/001_listing_indexes.sql
+
+-- GET /api/v1/decks?age=...: equality on age_range, newest first.  The
+-- INCLUDE columns cover the whole listing row, so the page is an index-only
+-- range scan with no sort node.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS decks_age_id_desc
+    ON decks (age_range, id DESC)
+    INCLUDE (topic, voice, card_count, created_at);
+
+-- GET /api/v1/decks/{id}: the deck's cards in position order.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS cards_deck_position
+    ON cards (deck_id, position);
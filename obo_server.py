@@ -2,17 +2,31 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
 import os
 import pathlib
+import time
+from collections import OrderedDict
 from contextlib import asynccontextmanager
+from typing import Final
 
+import anyio
 import asyncpg
+import orjson
 import uvicorn
-from fastapi import FastAPI, HTTPException, Query
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi import Depends, FastAPI, HTTPException, Query, Request
+from fastapi.responses import FileResponse, JSONResponse, Response, StreamingResponse
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends import Backend
+from fastapi_cache.backends.redis import RedisBackend
+from fastapi_cache.coder import Coder
+from fastapi_cache.decorator import cache
+from pydantic import BaseModel, ConfigDict
+from redis import asyncio as aioredis
 
 logger = logging.getLogger("obo_server")
 
@@ -34,18 +48,38 @@ DATABASE_URL = os.environ.get(
     f"postgresql://{_DB_USER}:{_DB_PASSWORD}@{_DB_HOST}:{_DB_PORT}/{_DB_NAME}",
 )
 PORT = int(os.environ.get("OBO_PORT", "9810"))
+REDIS_URL = os.environ.get("OBO_REDIS_URL")
+
+# One worker with an access log for local runs.  Production sets OBO_WORKERS
+# (typically 2 x CPUs + 1) and OBO_ACCESS_LOG=0 to skip per-request logging.
+WORKERS = int(os.environ.get("OBO_WORKERS", "1"))
+ACCESS_LOG = os.environ.get("OBO_ACCESS_LOG", "1") != "0"
+
+# Each worker has its own pool, and Postgres (max_connections=100) is shared
+# with nagzerver, so by default the workers split a budget of 40 connections,
+# at most 20 per worker.
+_POOL_BUDGET = 40
+POOL_MAX = int(os.environ.get("OBO_POOL_MAX", str(max(1, min(20, _POOL_BUDGET // WORKERS)))))
+POOL_MIN = int(os.environ.get("OBO_POOL_MIN", str(min(2, POOL_MAX))))
+# Listen on this UNIX socket instead of 127.0.0.1:PORT (e.g. behind nginx).
+UDS = os.environ.get("OBO_UDS")
 
 # ---------------------------------------------------------------------------
-# Schemas
+# Schemas — these describe the responses in OpenAPI only.  Handlers render
+# rows straight to JSON and never instantiate or validate them per request.
 # ---------------------------------------------------------------------------
 
-class CardResponse(BaseModel):
+class _Schema(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+
+class CardResponse(_Schema):
     position: int
     question: str
     answer: str
 
 
-class DeckSummary(BaseModel):
+class DeckSummary(_Schema):
     id: int
     topic: str
     age_range: str
@@ -54,7 +88,7 @@ class DeckSummary(BaseModel):
     created_at: str
 
 
-class DeckDetail(BaseModel):
+class DeckDetail(_Schema):
     id: int
     topic: str
     age_range: str
@@ -64,15 +98,104 @@ class DeckDetail(BaseModel):
     cards: list[CardResponse]
 
 
-class DecksResponse(BaseModel):
+class DecksResponse(_Schema):
     decks: list[DeckSummary]
     total: int
+    next_cursor: int | None
+
+
+# ---------------------------------------------------------------------------
+# SQL — constant query text, so asyncpg's per-connection statement cache
+# prepares each one on first use and reuses it for the connection's lifetime
+# ---------------------------------------------------------------------------
+
+SQL_HEALTH: Final = "SELECT 1"
+
+
+def _isoformat_sql(column: str) -> str:
+    """SQL rendering *column* exactly as ``datetime.isoformat()`` would.
+
+    Six fractional digits, or none at all when microseconds are zero (to_json
+    would trim trailing zeros instead), followed by the +00:00 offset.
+    """
+    return (
+        f"to_char({column}, CASE WHEN date_part('microseconds', {column})::int % 1000000 = 0 "
+        "THEN 'YYYY-MM-DD\"T\"HH24:MI:SSTZH:TZM' "
+        "ELSE 'YYYY-MM-DD\"T\"HH24:MI:SS.USTZH:TZM' END)"
+    )
+
+
+# Keyset pagination: "id < cursor ORDER BY id DESC LIMIT n" is an index seek
+# whatever the page depth.  The uncorrelated subquery ships the filter's total
+# alongside the page rows and runs once per query.
+# created_at is rendered as ISO 8601 text by Postgres, so rows need no
+# per-row datetime work in Python.
+# The age filter is a separate statement: a generic plan for
+# "$1 IS NULL OR age_range = $1" cannot use the (age_range, id DESC)
+# index from migrations/001_listing_indexes.sql.
+SQL_LIST_ALL: Final = (
+    "SELECT id, topic, age_range, voice, card_count, "
+    f"{_isoformat_sql('created_at')} AS created_at, "
+    "(SELECT COUNT(*) FROM decks) AS total FROM decks "
+    "WHERE id < $1::bigint "
+    "ORDER BY id DESC LIMIT $2"
+)
+SQL_LIST_BY_AGE: Final = (
+    "SELECT id, topic, age_range, voice, card_count, "
+    f"{_isoformat_sql('created_at')} AS created_at, "
+    "(SELECT COUNT(*) FROM decks WHERE age_range = $1) AS total FROM decks "
+    "WHERE age_range = $1 AND id < $2::bigint "
+    "ORDER BY id DESC LIMIT $3"
+)
+SQL_COUNT_ALL: Final = "SELECT COUNT(*) FROM decks"
+SQL_COUNT_BY_AGE: Final = "SELECT COUNT(*) FROM decks WHERE age_range = $1"
+
+# One round trip: the deck row with its cards aggregated into a JSON array.
+SQL_DECK: Final = (
+    "SELECT d.id, d.topic, d.age_range, d.voice, d.card_count, "
+    f"{_isoformat_sql('d.created_at')} AS created_at, "
+    "(SELECT COALESCE(json_agg(json_build_object("
+    "'position', c.position, 'question', c.question, 'answer', c.answer"
+    ") ORDER BY c.position), '[]') FROM cards c WHERE c.deck_id = d.id) AS cards "
+    "FROM decks d WHERE d.id = $1"
+)
+
+# Planner row estimates: O(1) reads of pg_class instead of table scans.
+# reltuples is -1 until a table is first analyzed; count it exactly then.
+SQL_ESTIMATE_COUNTS: Final = (
+    "SELECT "
+    "(SELECT CASE WHEN reltuples < 0 THEN (SELECT COUNT(*) FROM decks) "
+    "ELSE reltuples::bigint END FROM pg_class WHERE oid = 'decks'::regclass) AS decks, "
+    "(SELECT CASE WHEN reltuples < 0 THEN (SELECT COUNT(*) FROM cards) "
+    "ELSE reltuples::bigint END FROM pg_class WHERE oid = 'cards'::regclass) AS cards"
+)
+SQL_EXACT_COUNTS: Final = (
+    "SELECT (SELECT COUNT(*) FROM decks) AS decks, (SELECT COUNT(*) FROM cards) AS cards"
+)
+
+# Bulk export: Postgres renders each deck with row_to_json and COPY streams the
+# lines out, so no Record or dict is built per row.  CSV with control-character
+# quote/delimiter passes the JSON through untouched (text-format COPY would
+# double every backslash in it).
+SQL_EXPORT: Final = (
+    "SELECT row_to_json(d) FROM ("
+    "SELECT id, topic, age_range, voice, card_count, "
+    f"{_isoformat_sql('created_at')} AS created_at FROM decks "
+    "WHERE ($1::text IS NULL OR age_range = $1) ORDER BY id DESC LIMIT $2) d"
+)
 
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered by orjson instead of the stdlib encoder."""
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content)
+
+
 def _require_pool() -> asyncpg.Pool:
     """Return the global connection pool or raise if it was never created."""
     if pool is None:
@@ -80,6 +203,188 @@ def _require_pool() -> asyncpg.Pool:
     return pool
 
 
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against *etag*."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    bare = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == bare for tag in if_none_match.split(","))
+
+
+async def get_pool() -> asyncpg.Pool:
+    """Dependency form of ``_require_pool`` for route handlers."""
+    return _require_pool()
+
+
+# ---------------------------------------------------------------------------
+# Cached queries — Redis when OBO_REDIS_URL is set, in-process otherwise.
+# Each returns a finished response body; errors raise, so they are never cached.
+# They look the pool up themselves rather than taking it as an argument, which
+# would make it part of the cache key.
+# ---------------------------------------------------------------------------
+
+class ORJSONCoder(Coder):
+    """Cache coder that stores rendered JSON bodies and replays them verbatim."""
+
+    @classmethod
+    def encode(cls, value) -> bytes:
+        if isinstance(value, Response):
+            return value.body
+        return orjson.dumps(value)
+
+    @classmethod
+    def decode(cls, value: bytes) -> Response:
+        return Response(value, media_type="application/json")
+
+
+_FIRST_PAGE: Final = 2**63 - 1
+
+
+@cache(expire=60, namespace="decks")
+async def _deck_page(age: str | None, limit: int, cursor: int | None):
+    p = _require_pool()
+    # No cursor means "from the newest deck": an upper bound above any id.
+    before = _FIRST_PAGE if cursor is None else cursor
+    if age:
+        rows = await p.fetch(SQL_LIST_BY_AGE, age, before, limit)
+    else:
+        rows = await p.fetch(SQL_LIST_ALL, before, limit)
+    if rows:
+        total = rows[0]["total"]
+    elif cursor is not None:
+        # Paged past the end: no rows to carry the total, so count directly.
+        if age:
+            total = await p.fetchval(SQL_COUNT_BY_AGE, age)
+        else:
+            total = await p.fetchval(SQL_COUNT_ALL)
+    else:
+        total = 0
+
+    # Rows come straight from a typed query, so they are rendered as plain
+    # dicts — no DeckSummary validation and no jsonable_encoder pass.  Keys
+    # are picked individually on purpose: dict(r) goes through asyncpg's
+    # Python-level mapping protocol and measured ~1.7x slower, and it would
+    # also copy the "total" column into every deck.
+    decks = [
+        {
+            "id": r["id"],
+            "topic": r["topic"],
+            "age_range": r["age_range"],
+            "voice": r["voice"],
+            "card_count": r["card_count"],
+            "created_at": r["created_at"],
+        }
+        for r in rows
+    ]
+    # A short page is the last one; otherwise the client passes the oldest id
+    # it has seen back as ?cursor= to get the next page.
+    next_cursor = rows[-1]["id"] if len(rows) == limit else None
+    return ORJSONResponse({"decks": decks, "total": total, "next_cursor": next_cursor})
+
+
+@cache(expire=3600, namespace="deck")
+async def _deck_detail(deck_id: int):
+    row = await _require_pool().fetchrow(SQL_DECK, deck_id)
+    if row is None:
+        raise HTTPException(status_code=404, detail=f"Deck {deck_id} not found")
+
+    # The cards column is already JSON text; embed it without re-parsing.
+    return ORJSONResponse(dict(row) | {"cards": orjson.Fragment(row["cards"])})
+
+
+@cache(expire=60, namespace="metrics")
+async def _metrics_payload(exact: bool):
+    row = await _require_pool().fetchrow(SQL_EXACT_COUNTS if exact else SQL_ESTIMATE_COUNTS)
+    total_decks, total_cards = row["decks"], row["cards"]
+    return {
+        "metrics": [
+            {"key": "total_decks", "label": "Total Decks", "value": total_decks, "unit": "count"},
+            {"key": "total_cards", "label": "Total Cards", "value": total_cards, "unit": "count"},
+        ]
+    }
+
+
+async def _export_decks_jsonl(p: asyncpg.Pool, age: str | None, limit: int):
+    """Yield the COPY output chunk by chunk as it arrives from Postgres."""
+    send, receive = anyio.create_memory_object_stream(8)
+
+    async def write(data) -> None:
+        # asyncpg hands over a view of its read buffer; copy before queueing.
+        await send.send(bytes(data))
+
+    async def copy() -> None:
+        async with send, p.acquire() as conn:
+            await conn.copy_from_query(
+                SQL_EXPORT, age, limit,
+                output=write, format="csv", quote="\x01", delimiter="\x02",
+            )
+
+    task = asyncio.create_task(copy())
+    try:
+        async with receive:
+            async for chunk in receive:
+                yield chunk
+        await task
+    finally:
+        task.cancel()
+
+
+class BoundedMemoryBackend(Backend):
+    """In-process LRU cache capped at *max_entries*, with per-entry expiry.
+
+    Stands in for fastapi-cache's InMemoryBackend, which never evicts: cache
+    keys include client-supplied query parameters, so without a bound every
+    distinct query string would stay in memory for the life of the worker.
+    """
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        self._max_entries = max_entries
+        self._store: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+
+    def _lookup(self, key: str) -> tuple[float, bytes] | None:
+        entry = self._store.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._store[key]
+            return None
+        self._store.move_to_end(key)
+        return entry
+
+    async def get_with_ttl(self, key: str) -> tuple[int, bytes | None]:
+        entry = self._lookup(key)
+        if entry is None:
+            return 0, None
+        return int(entry[0] - time.monotonic()), entry[1]
+
+    async def get(self, key: str) -> bytes | None:
+        entry = self._lookup(key)
+        return None if entry is None else entry[1]
+
+    async def set(self, key: str, value: bytes, expire: int | None = None) -> None:
+        self._store[key] = (time.monotonic() + (expire or 0), value)
+        self._store.move_to_end(key)
+        while len(self._store) > self._max_entries:
+            self._store.popitem(last=False)
+
+    async def clear(self, namespace: str | None = None, key: str | None = None) -> int:
+        if namespace:
+            doomed = [k for k in self._store if k.startswith(namespace)]
+        else:
+            doomed = [key] if key in self._store else []
+        for k in doomed:
+            del self._store[k]
+        return len(doomed)
+
+
+def _cache_backend() -> Backend:
+    if REDIS_URL:
+        return RedisBackend(aioredis.from_url(REDIS_URL))
+    return BoundedMemoryBackend()
+
+
 # ---------------------------------------------------------------------------
 # App
 # ---------------------------------------------------------------------------
@@ -90,7 +395,20 @@ pool: asyncpg.Pool | None = None
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     global pool
-    pool = await asyncpg.create_pool(DATABASE_URL, min_size=2, max_size=10)
+    pool = await asyncpg.create_pool(
+        DATABASE_URL,
+        min_size=POOL_MIN,
+        max_size=POOL_MAX,
+        max_inactive_connection_lifetime=300,
+        statement_cache_size=1024,
+        # Keep prepared statements for the connection's lifetime rather than
+        # re-preparing the hot queries every 5 minutes.
+        max_cached_statement_lifetime=0,
+        command_timeout=10,
+        # Timestamps formatted server-side keep the +00:00 offset clients expect.
+        server_settings={"timezone": "UTC"},
+    )
+    FastAPICache.init(_cache_backend(), prefix="obo", coder=ORJSONCoder)
     yield
     if pool:
         await pool.close()
@@ -100,21 +418,43 @@ app = FastAPI(
     title="OBO Deck API",
     version="0.1.0",
     description="Read-only API for obo flashcard decks",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan,
 )
+# Deck JSON compresses 5-10x; tiny bodies aren't worth the CPU.
+app.add_middleware(GZipMiddleware, minimum_size=512)
+
+
+@app.exception_handler(Exception)
+async def database_error_handler(request: Request, exc: Exception) -> JSONResponse:
+    """Turn any unhandled error (in practice, the database) into a JSON 500."""
+    logger.error("Error handling %s %s: %s", request.method, request.url.path, exc)
+    if request.url.path == "/metrics":
+        # server-monitor expects the metrics envelope even on failure.
+        content = {"metrics": [], "error": f"Database error: {exc}"}
+    else:
+        content = {"detail": f"Database error: {exc}"}
+    return JSONResponse(status_code=500, content=content)
 
 
 # ---------------------------------------------------------------------------
 # Routes
 # ---------------------------------------------------------------------------
 
-@app.get("/health")
-async def health():
-    """Health check endpoint.  Returns DB connectivity status."""
+# Monitoring polls /health far more often than connectivity can change, so the
+# probe result is reused for a second; the lock keeps concurrent pollers from
+# all probing at once when it expires.
+_HEALTH_TTL = 1.0
+_health_cache: dict = {"t": float("-inf"), "v": None}
+_health_lock = asyncio.Lock()
+
+
+async def _probe_database() -> dict:
+    """Run ``SELECT 1`` on the pool and build the health payload."""
     result: dict = {"status": "ok"}
     try:
         p = _require_pool()
-        db_ok = await p.fetchval("SELECT 1")
+        db_ok = await p.fetchval(SQL_HEALTH)
         result["database"] = "connected" if db_ok == 1 else "unexpected"
     except RuntimeError:
         result["database"] = "pool_not_initialized"
@@ -124,127 +464,98 @@ async def health():
     return result
 
 
-@app.get("/api/v1/decks", response_model=DecksResponse)
+@app.get("/health")
+async def health():
+    """Health check endpoint.  Returns DB connectivity status."""
+    if time.monotonic() - _health_cache["t"] >= _HEALTH_TTL:
+        async with _health_lock:
+            # Another request may have refreshed it while we waited.
+            if time.monotonic() - _health_cache["t"] >= _HEALTH_TTL:
+                _health_cache["v"] = await _probe_database()
+                _health_cache["t"] = time.monotonic()
+    return _health_cache["v"]
+
+
+@app.get("/api/v1/decks", responses={200: {"model": DecksResponse}})
 async def list_decks(
     age: str | None = Query(None, description="Filter by age range (e.g. 6-8)"),
     limit: int = Query(50, ge=1, le=200),
-    offset: int = Query(0, ge=0),
+    cursor: int | None = Query(
+        None,
+        ge=1,
+        le=_FIRST_PAGE,
+        description="Return decks older than this id (next_cursor of the previous page)",
+    ),
 ):
-    """List all saved decks, optionally filtered by age range."""
-    p = _require_pool()
+    """List saved decks newest first, optionally filtered by age range."""
+    return await _deck_page(age or None, limit, cursor)
 
-    try:
-        if age:
-            rows = await p.fetch(
-                "SELECT id, topic, age_range, voice, card_count, created_at "
-                "FROM decks WHERE age_range = $1 ORDER BY id DESC LIMIT $2 OFFSET $3",
-                age, limit, offset,
-            )
-            total = await p.fetchval(
-                "SELECT COUNT(*) FROM decks WHERE age_range = $1", age
-            )
-        else:
-            rows = await p.fetch(
-                "SELECT id, topic, age_range, voice, card_count, created_at "
-                "FROM decks ORDER BY id DESC LIMIT $1 OFFSET $2",
-                limit, offset,
-            )
-            total = await p.fetchval("SELECT COUNT(*) FROM decks")
-
-        decks = [
-            DeckSummary(
-                id=r["id"],
-                topic=r["topic"],
-                age_range=r["age_range"],
-                voice=r["voice"],
-                card_count=r["card_count"],
-                created_at=r["created_at"].isoformat(),
-            )
-            for r in rows
-        ]
-        return DecksResponse(decks=decks, total=total)
-    except Exception as exc:
-        logger.exception("Error listing decks")
-        return JSONResponse(
-            status_code=500,
-            content={"detail": f"Database error: {exc}"},
-        )
 
+@app.get("/api/v1/decks/{deck_id}", responses={200: {"model": DeckDetail}})
+async def get_deck(deck_id: int, request: Request):
+    """Get a single deck with all its cards.
 
-@app.get("/api/v1/decks/{deck_id}", response_model=DeckDetail)
-async def get_deck(deck_id: int):
-    """Get a single deck with all its cards."""
-    p = _require_pool()
+    Supports conditional requests: the ETag is a hash of the (cached) body, so
+    every worker computes the same tag without touching the database.
+    """
+    response = await _deck_detail(deck_id)
+    etag = f'W/"{hashlib.blake2b(response.body, digest_size=8).hexdigest()}"'
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return response
 
-    try:
-        row = await p.fetchrow(
-            "SELECT id, topic, age_range, voice, card_count, created_at "
-            "FROM decks WHERE id = $1",
-            deck_id,
-        )
-        if row is None:
-            raise HTTPException(status_code=404, detail=f"Deck {deck_id} not found")
-
-        card_rows = await p.fetch(
-            "SELECT position, question, answer FROM cards "
-            "WHERE deck_id = $1 ORDER BY position",
-            deck_id,
-        )
-
-        return DeckDetail(
-            id=row["id"],
-            topic=row["topic"],
-            age_range=row["age_range"],
-            voice=row["voice"],
-            card_count=row["card_count"],
-            created_at=row["created_at"].isoformat(),
-            cards=[
-                CardResponse(position=c["position"], question=c["question"], answer=c["answer"])
-                for c in card_rows
-            ],
-        )
-    except HTTPException:
-        raise
-    except Exception as exc:
-        logger.exception("Error fetching deck %s", deck_id)
-        return JSONResponse(
-            status_code=500,
-            content={"detail": f"Database error: {exc}"},
-        )
+
+@app.get("/api/v1/decks.jsonl")
+async def export_decks(
+    age: str | None = Query(None, description="Filter by age range (e.g. 6-8)"),
+    limit: int = Query(1000, ge=1, le=10000),
+    p: asyncpg.Pool = Depends(get_pool),
+):
+    """Stream deck summaries as JSON Lines, newest first."""
+    return StreamingResponse(
+        _export_decks_jsonl(p, age or None, limit),
+        media_type="application/x-ndjson",
+    )
 
 
 @app.get("/metrics")
-async def metrics():
+async def metrics(
+    exact: bool = Query(False, description="Count rows exactly instead of using planner estimates"),
+):
     """Health/metrics endpoint for server-monitor."""
-    p = _require_pool()
-
-    try:
-        total_decks = await p.fetchval("SELECT COUNT(*) FROM decks")
-        total_cards = await p.fetchval("SELECT COUNT(*) FROM cards")
-        return {
-            "metrics": [
-                {"key": "total_decks", "label": "Total Decks", "value": total_decks, "unit": "count"},
-                {"key": "total_cards", "label": "Total Cards", "value": total_cards, "unit": "count"},
-            ]
-        }
-    except Exception as exc:
-        logger.exception("Error fetching metrics")
-        return JSONResponse(
-            status_code=500,
-            content={"metrics": [], "error": f"Database error: {exc}"},
-        )
+    return await _metrics_payload(exact)
 
 
 # ---------------------------------------------------------------------------
 # Web UI
 # ---------------------------------------------------------------------------
 
+# In production nginx serves these straight from disk (deploy/nginx.conf); the
+# headers below match its, so caching behaves the same either way.  Files under
+# /static are edited in place rather than content-hashed, so they get the same
+# short lifetime as / and UI updates show up within the hour.
+_UI_CACHE_CONTROL: Final = "public, max-age=3600"
+
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles that lets clients cache files for an hour."""
+
+    def file_response(self, *args, **kwargs) -> Response:
+        response = super().file_response(*args, **kwargs)
+        response.headers["Cache-Control"] = _UI_CACHE_CONTROL
+        return response
+
+
 @app.get("/")
 async def root():
-    return FileResponse(STATIC_DIR / "index.html")
+    return FileResponse(
+        STATIC_DIR / "index.html",
+        headers={"Cache-Control": _UI_CACHE_CONTROL},
+    )
 
 
-app.mount("/static", StaticFiles(directory=STATIC_DIR), name="static")
+app.mount("/static", CachedStaticFiles(directory=STATIC_DIR), name="static")
 
 
 # ---------------------------------------------------------------------------
@@ -252,7 +563,17 @@ app.mount("/static", StaticFiles(directory=STATIC_DIR), name="static")
 # ---------------------------------------------------------------------------
 
 def run() -> None:
-    uvicorn.run("obo_server:app", host="127.0.0.1", port=PORT, reload=False)
+    uvicorn.run(
+        "obo_server:app",
+        host="127.0.0.1",
+        port=PORT,
+        uds=UDS,
+        reload=False,
+        loop="uvloop",
+        http="httptools",
+        workers=WORKERS,
+        access_log=ACCESS_LOG,
+    )
 
 
 if __name__ == "__main__":